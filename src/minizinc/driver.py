@@ -5,7 +5,6 @@
 import os
 import platform
 import re
-import shutil
 import subprocess
 import sys
 from asyncio import create_subprocess_exec
@@ -13,7 +12,7 @@ from asyncio.subprocess import PIPE, Process
 from dataclasses import fields
 from json import loads
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import minizinc
 
@@ -23,6 +22,8 @@ from .solver import Solver
 
 #: MiniZinc version required by the python package
 CLI_REQUIRED_VERSION = (2, 6, 0)
+#: Buffer limit of the streams of asynchronous MiniZinc processes
+STREAM_LIMIT = 8 * 1024 * 1024
 #: Default locations on MacOS where the MiniZinc packaged release would be installed
 MAC_LOCATIONS = [
     str(Path("/Applications/MiniZincIDE.app/Contents/Resources")),
@@ -268,6 +269,7 @@ class Driver:
                 stdin=None,
                 stdout=PIPE,
                 stderr=PIPE,
+                limit=STREAM_LIMIT,
                 **windows_spawn_options,
             )
         else:
@@ -285,6 +287,7 @@ class Driver:
                 stdin=None,
                 stdout=PIPE,
                 stderr=PIPE,
+                limit=STREAM_LIMIT,
                 **windows_spawn_options,
             )
         return proc
@@ -315,7 +318,52 @@ class Driver:
                 path.extend(WIN_LOCATIONS)
 
         # Try to locate the MiniZinc executable
-        executable = shutil.which(name, path=os.pathsep.join(path))
+        executable = _which_in_dirs(name, path)
         if executable is not None:
             return cls(Path(executable))
         return None
+
+
+def _which_in_dirs(name: str, dirs: Iterable[str]) -> Optional[str]:
+    """Locate an executable in a list of directories
+
+    Behaves like ``shutil.which``, but takes the directories to search
+    directly, rather than as a single ``os.pathsep`` separated string.
+    Directories that occur multiple times are only probed once.
+
+    Args:
+        name: Name of the executable.
+        dirs: Directories to search, in order of preference.
+
+    Returns:
+        Optional[str]: Path to the first matching executable or None.
+    """
+    candidates = [name]
+    if sys.platform == "win32":
+        # On Windows the executable can be found using any of the extensions
+        # listed in PATHEXT
+        pathext = [
+            ext
+            for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(
+                os.pathsep
+            )
+            if ext
+        ]
+        if not any(name.lower().endswith(ext.lower()) for ext in pathext):
+            candidates = [name + ext for ext in pathext]
+
+    seen = set()
+    for d in dirs:
+        normdir = os.path.normcase(d)
+        if normdir in seen:
+            continue
+        seen.add(normdir)
+        for candidate in candidates:
+            file = os.path.join(d, candidate)
+            if (
+                os.path.exists(file)
+                and os.access(file, os.X_OK)
+                and not os.path.isdir(file)
+            ):
+                return file
+    return None
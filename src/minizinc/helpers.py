@@ -1,9 +1,16 @@
+import hashlib
+import os
 import sys
-from dataclasses import asdict, is_dataclass
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import timedelta
-from typing import Any, Dict, Optional, Sequence, Union
+from enum import EnumMeta
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple, Union
+from weakref import WeakKeyDictionary
 
 import minizinc
+from minizinc.instance import _DATA_ENCODER
 
 if sys.version_info >= (3, 8):
     from typing import Protocol
@@ -16,12 +23,37 @@ if sys.version_info >= (3, 8):
 else:
     DataClass = Any
 
+#: Default time limit for checking a single solution
+CHECK_TIME_LIMIT = timedelta(seconds=30)
+#: Maximum number of solution checks remembered by check_solution
+CHECK_CACHE_SIZE = 512
+_check_cache: "OrderedDict[bytes, bool]" = OrderedDict()
+_check_cache_lock = threading.Lock()
+# Analysed instances used by check_result, for every model and solver
+_instance_cache: WeakKeyDictionary = WeakKeyDictionary()
+_instance_cache_lock = threading.Lock()
+
+# Solution members that are not variables of the model
+_EXCLUDED = frozenset({"objective", "__output_item", "_output_item", "_checker"})
+
+# Pairs of (expected, found) statuses that confirm a solution is correct
+_SOLVED = frozenset({minizinc.Status.SATISFIED, minizinc.Status.OPTIMAL_SOLUTION})
+_COMPATIBLE = frozenset(
+    {(s, s) for s in minizinc.Status}
+    | {
+        (expected, found)
+        for expected in _SOLVED | {minizinc.Status.ALL_SOLUTIONS}
+        for found in _SOLVED
+    }
+)
+
 
 def check_result(
     model: minizinc.Model,
     result: minizinc.Result,
     solver: minizinc.Solver,
     solution_nrs: Optional[Sequence[int]] = None,
+    use_cache: bool = True,
 ) -> bool:
     """Checks a result object for a model using the given solver.
 
@@ -29,7 +61,10 @@ def check_result(
     configuration. The solver configuration is now used to confirm is
     assignment of the variables is correct. By default only the last solution
     will be checked. A sequence of solution numbers can be provided to check
-    multiple solutions.
+    multiple solutions. Multiple solutions are checked concurrently, each in
+    their own MiniZinc process. Once an incorrect solution is found, the checks
+    that have not yet started are skipped, but the checks that are already
+    running are completed before the result is returned.
 
     Args:
         model (Model): To model for which the solution was provided
@@ -38,22 +73,73 @@ def check_result(
             solutions.
         solution_nrs: The index set of solutions to be checked. (default:
             ``-1``)
+        use_cache (bool): Whether to reuse the analysed model and the outcome
+            of earlier checks of the same solutions, and remember them for
+            later checks (see :func:`check_solution`).
 
     Returns:
         bool: True if the given result object is correctly verified.
 
     """
     if solution_nrs is None:
-        solution_nrs = [-1]
+        solution_nrs = (-1,)
 
     solutions = (
         result.solution if isinstance(result.solution, list) else [result.solution]
     )
 
-    for i in solution_nrs:
-        sol = solutions[i]
-        if not check_solution(model, sol, result.status, solver):
-            return False
+    # Analyse the model once, every solution is checked on a branch of
+    # this instance.
+    if use_cache:
+        instance = _cached_instance(model, solver)
+    else:
+        instance = minizinc.Instance(solver, model)
+
+    if len(solution_nrs) <= 1:
+        return all(
+            _check_solution(
+                model,
+                solutions[i],
+                result.status,
+                solver,
+                CHECK_TIME_LIMIT,
+                instance,
+                use_cache,
+            )
+            for i in solution_nrs
+        )
+
+    # Ensure the analysis is not repeated by every thread
+    if instance._method_cache is None:
+        instance.analyse()
+
+    # The solver runs in a separate process, so the checks can be run
+    # concurrently from different threads.
+    with ThreadPoolExecutor(
+        max_workers=min(len(solution_nrs), os.cpu_count() or 1)
+    ) as executor:
+        futures = [
+            executor.submit(
+                _check_solution,
+                model,
+                solutions[i],
+                result.status,
+                solver,
+                CHECK_TIME_LIMIT,
+                instance,
+                use_cache,
+            )
+            for i in solution_nrs
+        ]
+        try:
+            for future in as_completed(futures):
+                if not future.result():
+                    return False
+        finally:
+            # Skip checks that have not yet started, leaving the executor to
+            # wait for the running checks
+            for future in futures:
+                future.cancel()
 
     return True
 
@@ -69,7 +155,8 @@ def check_solution(
     solution: Union[DataClass, Dict[str, Any]],
     status: minizinc.Status,
     solver: minizinc.Solver,
-    time_limit: Optional[timedelta] = timedelta(seconds=30),
+    time_limit: Optional[timedelta] = CHECK_TIME_LIMIT,
+    use_cache: bool = True,
 ) -> bool:
     """Checks a solution for a model using the given solver.
 
@@ -78,6 +165,11 @@ def check_solution(
     available values from the given solution. The Instance.solve() method is
     then used to ensure that the same solution with the same expected status is
     reached. Note that this method will not check the optimality of a solution.
+    The outcome of a check is remembered (unless ``use_cache`` is ``False``),
+    so checking the same solution for the same model and solver again will not
+    start a new MiniZinc process. Files included by the model are recognised as
+    changed by their modification time and size, but files that they include
+    in turn are not tracked.
 
     Args:
         model (Model): The model for which the solution was provided.
@@ -87,6 +179,8 @@ def check_solution(
             solution.
         time_limit (Optional(timedelta)): An optional time limit to check the
             solution.
+        use_cache (bool): Whether to reuse the outcome of an earlier check of
+            the same solution, and remember the outcome of this check.
 
     Returns:
         bool: True if the given solution are correctly verified.
@@ -94,27 +188,176 @@ def check_solution(
     Raises:
         TimeoutError: the given time limit was exceeded.
     """
-    instance = minizinc.Instance(solver, model)
-    if is_dataclass(solution):
-        solution = asdict(solution)
-
-    assert isinstance(solution, dict)
-    for k, v in solution.items():
-        if k not in ("objective", "__output_item"):
-            instance[k] = v
+    return _check_solution(
+        model, solution, status, solver, time_limit, use_cache=use_cache
+    )
+
+
+def _cached_instance(
+    model: minizinc.Model, solver: minizinc.Solver
+) -> minizinc.Instance:
+    """Returns an Instance of the model for the given solver.
+
+    The instance is reused by later calls for the same model, solver, and
+    MiniZinc executable, as long as the model (and the files it includes) have
+    not been changed in the meantime.
+    """
+    # New instances use the default driver, which can be changed at any time
+    driver = minizinc.default_driver
+    key = (
+        None if driver is None else str(driver.executable),
+        solver._identifier,
+        solver.output_configuration(),
+    )
+    version = _model_key(model)
+    if version is None:
+        return minizinc.Instance(solver, model)
+    with _instance_cache_lock:
+        instances = _instance_cache.setdefault(model, {})
+        if key in instances and instances[key][0] == version:
+            return instances[key][1]
+        instance = minizinc.Instance(solver, model)
+        instances[key] = (version, instance)
+        return instance
+
+
+def _model_key(model: minizinc.Model) -> Optional[bytes]:
+    """Fingerprint of the contents of a model and its parents
+
+    Included files are represented by their path, modification time, and size,
+    and data by its JSON encoding. Files that are included from MiniZinc code
+    are not tracked.
+
+    Returns:
+        Optional[bytes]: The fingerprint, or None when the data of the model
+        cannot be encoded.
+    """
+    key = hashlib.blake2b()
+    inst: Optional[minizinc.Model] = model
+    try:
+        while inst is not None:
+            for file in inst._includes:
+                stat = file.stat()
+                key.update(repr((str(file), stat.st_mtime_ns, stat.st_size)).encode())
+            for code in inst._code_fragments:
+                key.update(repr(code).encode())
+            data = {
+                k: list(v.__members__) if isinstance(v, EnumMeta) else v
+                for k, v in inst._data.items()
+            }
+            key.update(_DATA_ENCODER.encode(data).encode())
+            inst = getattr(inst, "_parent", None)
+    except (OSError, TypeError, ValueError):
+        return None
+    return key.digest()
+
+
+def _check_key(
+    model: minizinc.Model,
+    solution: Union[DataClass, Dict[str, Any]],
+    status: minizinc.Status,
+    solver: minizinc.Solver,
+    time_limit: Optional[timedelta],
+    driver: Optional[minizinc.Driver],
+) -> Optional[bytes]:
+    """Computes the key under which the outcome of a solution check is stored.
+
+    The key includes the MiniZinc executable of the driver that runs the
+    check, so switching between MiniZinc versions does not reuse outcomes.
+
+    Returns:
+        Optional[bytes]: The key, or None when the outcome cannot be stored.
+    """
+    model_key = _model_key(model)
+    if model_key is None:
+        return None
+    values = dict(_solution_items(solution))
+    try:
+        encoded = _DATA_ENCODER.encode(values)
+    except (TypeError, ValueError):
+        return None
+    key = hashlib.blake2b(model_key)
+    key.update(
+        repr(
+            (
+                None if driver is None else str(driver.executable),
+                solver._identifier,
+                solver.output_configuration(),
+                status,
+                time_limit,
+            )
+        ).encode()
+    )
+    key.update(encoded.encode())
+    return key.digest()
+
+
+def _check_solution(
+    model: minizinc.Model,
+    solution: Union[DataClass, Dict[str, Any]],
+    status: minizinc.Status,
+    solver: minizinc.Solver,
+    time_limit: Optional[timedelta],
+    instance: Optional[minizinc.Instance] = None,
+    use_cache: bool = True,
+) -> bool:
+    """Checks a solution, reusing the outcome of earlier checks when possible.
+
+    If an instance of the model for the given solver is provided, then the
+    solution is checked on a branch of this instance, which avoids analysing
+    the model again.
+    """
+    key = None
+    if use_cache:
+        driver = minizinc.default_driver if instance is None else instance._driver
+        key = _check_key(model, solution, status, solver, time_limit, driver)
+    if key is not None:
+        with _check_cache_lock:
+            if key in _check_cache:
+                _check_cache.move_to_end(key)
+                return _check_cache[key]
+
+    if instance is None:
+        instance = minizinc.Instance(solver, model)
+    else:
+        instance = instance._branch()
+    correct = _check_assignment(instance, solution, status, time_limit)
+
+    if key is not None:
+        with _check_cache_lock:
+            _check_cache[key] = correct
+            if len(_check_cache) > CHECK_CACHE_SIZE:
+                _check_cache.popitem(last=False)
+    return correct
+
+
+def _solution_items(
+    solution: Union[DataClass, Dict[str, Any]],
+) -> Iterator[Tuple[str, Any]]:
+    """Iterates over the assignments of a solution to variables of the model."""
+    # Read the fields directly, asdict would (deep) copy all values
+    items: Iterator[Tuple[str, Any]]
+    if hasattr(solution, "__dataclass_fields__"):
+        fields = solution.__dataclass_fields__  # type: ignore
+        items = ((k, getattr(solution, k)) for k in fields)
+    else:
+        assert isinstance(solution, dict)
+        items = iter(solution.items())
+    return ((k, v) for k, v in items if k not in _EXCLUDED)
+
+
+def _check_assignment(
+    instance: minizinc.Instance,
+    solution: Union[DataClass, Dict[str, Any]],
+    status: minizinc.Status,
+    time_limit: Optional[timedelta],
+) -> bool:
+    for k, v in _solution_items(solution):
+        instance[k] = v
     check = instance.solve(time_limit=time_limit)
 
     if check.status is minizinc.Status.UNKNOWN:
         raise TimeoutError(
             f"Solution checking failed because the checker exceeded the allotted time limit of {time_limit}"
         )
-    elif status == check.status:
-        return True
-    return check.status in [
-        minizinc.Status.SATISFIED,
-        minizinc.Status.OPTIMAL_SOLUTION,
-    ] and status in [
-        minizinc.Status.SATISFIED,
-        minizinc.Status.OPTIMAL_SOLUTION,
-        minizinc.Status.ALL_SOLUTIONS,
-    ]
+    return (status, check.status) in _COMPATIBLE
@@ -3,12 +3,17 @@
 #  file, You can obtain one at http://mozilla.org/MPL/2.0/.
 import asyncio
 import contextlib
+import functools
+import hashlib
 import json
 import os
 import re
 import sys
 import tempfile
+import threading
 import warnings
+import weakref
+from collections import OrderedDict, deque
 from dataclasses import field, make_dataclass
 from datetime import timedelta
 from enum import EnumMeta
@@ -18,13 +23,17 @@ from pathlib import Path
 from typing import (
     Any,
     AsyncIterator,
+    Coroutine,
+    Deque,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Optional,
     Set,
     Tuple,
     Type,
+    TypeVar,
     Union,
 )
 
@@ -39,9 +48,14 @@ from .json import (
     decode_json_stream,
 )
 from .model import Method, Model, ParPath, UnknownExpression
-from .result import Result, Status, set_stat
+from .result import _STATUS_MAP, Result, Status, set_stat
 from .solver import Solver
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 if sys.version_info >= (3, 8):
     from typing import Final
 
@@ -50,6 +64,142 @@ else:
     SEPARATOR: bytes = str.encode("----------" + os.linesep)
 
 
+#: Number of bytes kept from the error stream of MiniZinc when solving
+STDERR_TAIL_SIZE = 1024 * 1024
+#: Maximum number of model interfaces remembered by Instance.analyse
+ANALYSIS_CACHE_SIZE = 128
+# Method, input, output, and whether there is an output item of a model
+_Analysis = Tuple[Method, Dict[str, Type], Dict[str, Type], bool]
+_analysis_cache: "OrderedDict[bytes, _Analysis]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
+_generated_files_lock = threading.Lock()
+
+_T = TypeVar("_T")
+
+#: Number of seconds to wait for a MiniZinc process to be stopped when
+#: Instance.solve is interrupted
+CANCEL_TIMEOUT = 5
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_thread_state = threading.local()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    if sys.platform == "win32":
+        # Subprocesses are only supported by the Proactor event loop
+        return asyncio.ProactorEventLoop()
+    elif uvloop is not None:
+        return uvloop.new_event_loop()
+    else:
+        return asyncio.new_event_loop()
+
+
+def _thread_loop() -> asyncio.AbstractEventLoop:
+    """Event loop used by the synchronous methods in the current thread
+
+    The event loop is created on first use and reused by later calls from the
+    same thread, which avoids creating a new event loop for every call. Every
+    thread has its own event loop, so solving from different threads does not
+    interfere. When the uvloop package is installed, it is used to run the
+    event loop.
+
+    Returns:
+        asyncio.AbstractEventLoop: the (not running) event loop of the thread
+    """
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _new_event_loop()
+        _thread_state.loop = loop
+    return loop
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Event loop used by the synchronous methods when a loop is running
+
+    The event loop is created on first use and runs in its own daemon thread
+    for the remainder of the program. It allows the synchronous methods to be
+    used while another event loop is running in the current thread (e.g., in
+    Jupyter notebooks).
+
+    Returns:
+        asyncio.AbstractEventLoop: the running background event loop
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = _new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="minizinc-event-loop", daemon=True
+            ).start()
+        return _loop
+
+
+def _run_sync(coroutine: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion from a synchronous method
+
+    The coroutine runs on the event loop of the current thread. When an event
+    loop is already running in the current thread, the coroutine is instead
+    run on the background event loop. If waiting for the coroutine is
+    interrupted, then the coroutine is cancelled, which stops its MiniZinc
+    process, before the exception is raised again.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        loop = _thread_loop()
+        task = loop.create_task(coroutine)
+        try:
+            return loop.run_until_complete(task)
+        except BaseException:
+            if not task.done():
+                task.cancel()
+                with contextlib.suppress(BaseException):
+                    loop.run_until_complete(task)
+            raise
+
+    started = threading.Event()
+    finished = threading.Event()
+
+    async def run() -> _T:
+        started.set()
+        try:
+            return await coroutine
+        finally:
+            finished.set()
+
+    future = asyncio.run_coroutine_threadsafe(run(), _background_loop())
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        # Give the background loop the chance to stop the MiniZinc process
+        if started.is_set():
+            finished.wait(CANCEL_TIMEOUT)
+        raise
+
+
+# Encoder for the data files of instances (reused, as it keeps no state)
+_DATA_ENCODER = MZNJSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# Statistics output by the MiniZinc compiler
+_STAT_RE = re.compile(rb"%%%mzn-stat:? (\w*)=([^\r\n]*)")
+
+# Standard command line arguments used by Instance.solutions()
+_SOLVE_ARGS = (
+    "--output-mode",
+    "json",  # Ensure MiniZinc's solutions are given as parsable JSON
+    "--output-objective",  # Output objective value with every solution
+)
+# Command line arguments used by Instance.solutions() to collect statistics
+_STATISTICS_ARGS = (
+    "--output-time",  # Output MiniZinc recorded time with every solution
+    "--statistics",  # Enable statistics
+)
+
+
 class _GeneratedSolution:
     pass
 
@@ -69,7 +219,11 @@ class Instance(Model):
     _method_cache: Optional[Method] = None
     _has_output_item_cache: Optional[bool] = None
     _parent: Optional["Instance"] = None
-    _field_renames: List[Tuple[str, str]]
+    _field_renames: Dict[str, str]
+    _solution_keys: Optional[
+        Tuple[Type, Tuple[str, ...], Tuple[str, ...], FrozenSet[str]]
+    ] = None
+    _generated: Optional[Tuple[bytes, List[Path], weakref.finalize]] = None
 
     def __init__(
         self,
@@ -79,7 +233,7 @@ class Instance(Model):
     ):
         super().__init__()
         self._solver = solver
-        self._field_renames = []
+        self._field_renames = {}
         if driver is not None:
             self._driver = driver
         elif minizinc.default_driver is not None:
@@ -112,6 +266,7 @@ class Instance(Model):
         free_search: bool = False,
         optimisation_level: Optional[int] = None,
         timeout: Optional[timedelta] = None,
+        collect_statistics: bool = True,
         **kwargs,
     ) -> Result:
         """Solves the Instance using its given solver configuration.
@@ -153,6 +308,9 @@ class Instance(Model):
                 - 4: Probe bounds of all variables at the root node
                 - 5: Probe values of all variables at the root node
 
+            collect_statistics (bool): Request statistical information from
+                MiniZinc and the solver. When set to ``False``, the statistics
+                of the result will be empty.
             **kwargs: Other flags to be passed onto the solver. ``--`` can be
                 omitted in the name of the flag. If the type of the flag is
                 Boolean, then its value signifies its occurrence.
@@ -168,6 +326,10 @@ class Instance(Model):
                 model instance.
 
         """
+        # Analyse the instance in the calling thread, and not on the (possibly
+        # shared) event loop
+        if self._method_cache is None:
+            self.analyse()
         coroutine = self.solve_async(
             time_limit=time_limit,
             nr_solutions=nr_solutions,
@@ -178,24 +340,10 @@ class Instance(Model):
             free_search=free_search,
             optimisation_level=optimisation_level,
             timeout=timeout,
+            collect_statistics=collect_statistics,
             **kwargs,
         )
-        try:
-            if sys.platform == "win32":
-                asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-            return asyncio.run(coroutine)
-        except RuntimeError as r:
-            if "called from a running event loop" in r.args[0]:
-                raise RuntimeError(
-                    "the synchronous MiniZinc Python `solve()` method was called from"
-                    " an asynchronous environment.\n\nBecause Python's asyncio library"
-                    " does not support using multiple event loops that would be"
-                    " required to use this method, we instead suggest you use the"
-                    " `solve_async()' method or patch Python behaviour with a package"
-                    " such as `nested_asyncio'.\n\nOriginal message: " + str(r)
-                ) from r
-            else:
-                raise r
+        return _run_sync(coroutine)
 
     async def solve_async(
         self,
@@ -208,6 +356,7 @@ class Instance(Model):
         free_search: bool = False,
         optimisation_level: Optional[int] = None,
         timeout: Optional[timedelta] = None,
+        collect_statistics: bool = True,
         **kwargs,
     ) -> Result:
         """Solves the Instance using its given solver configuration in a coroutine.
@@ -246,6 +395,7 @@ class Instance(Model):
             free_search=free_search,
             optimisation_level=optimisation_level,
             timeout=timeout,
+            collect_statistics=collect_statistics,
             **kwargs,
         ):
             status = result.status
@@ -270,6 +420,7 @@ class Instance(Model):
         verbose: bool = False,
         debug_output: Optional[Path] = None,
         timeout: Optional[timedelta] = None,
+        collect_statistics: bool = True,
         **kwargs,
     ) -> AsyncIterator[Result]:
         """An asynchronous generator for solutions of the MiniZinc instance.
@@ -298,13 +449,9 @@ class Instance(Model):
 
         method = self.method  # Ensure self.analyse() has been executed
         # Set standard command line arguments
-        cmd: List[Union[str, Path]] = [
-            "--output-mode",
-            "json",  # Ensure MiniZinc's solutions are given as parsable JSON
-            "--output-time",  # Output MiniZinc recorded time with every solution
-            "--output-objective",  # Output objective value with every solution
-            "--statistics",  # Enable statistics
-        ]
+        cmd: List[Union[str, Path]] = list(_SOLVE_ARGS)
+        if collect_statistics:
+            cmd.extend(_STATISTICS_ARGS)
         # Add the model's evaluated output item to the json output object
         if self.has_output_item:
             cmd.append("--output-output-item")
@@ -362,14 +509,7 @@ class Instance(Model):
         if verbose:
             cmd.append("--verbose")
 
-        for flag, value in kwargs.items():
-            if not flag.startswith("-"):
-                flag = "--" + flag
-            if isinstance(value, bool):
-                if value:
-                    cmd.append(flag)
-            else:
-                cmd.extend([flag, value])
+        cmd.extend(_kwargs_to_argv(kwargs))
 
         multiple_solutions = (
             all_solutions or intermediate_solutions or (nr_solutions is not None)
@@ -394,7 +534,14 @@ class Instance(Model):
                 assert isinstance(proc.stderr, asyncio.StreamReader)
                 assert isinstance(proc.stdout, asyncio.StreamReader)
 
-                read_stderr = asyncio.create_task(_read_all(proc.stderr))
+                # Only keep the end of the error stream (which contains any
+                # error message), unless all output was requested
+                if debug_output is None:
+                    read_stderr = asyncio.create_task(
+                        _read_tail(proc.stderr, STDERR_TAIL_SIZE)
+                    )
+                else:
+                    read_stderr = asyncio.create_task(_read_all(proc.stderr))
 
                 async for obj in decode_async_json_stream(
                     proc.stdout, cls=MZNJSONDecoder, enum_map=self._enum_map
@@ -484,7 +631,20 @@ class Instance(Model):
         Yields:
             Instance: branched child instance
         """
-        child = self.__class__(self._solver)
+        child = self._branch()
+        with self._lock:
+            yield child
+
+    def _branch(self) -> "Instance":
+        """Create a child instance without locking the current instance
+
+        The caller is responsible for ensuring that no changes are made to the
+        current instance while the child instance is still alive.
+
+        Returns:
+            Instance: branched child instance
+        """
+        child = self.__class__(self._solver, driver=self._driver)
         child._parent = self
 
         # Copy current information from analysis
@@ -492,9 +652,10 @@ class Instance(Model):
         child.output_type = self.output_type
         child._output_cache = self._output_cache
         child._input_cache = self._input_cache
-
-        with self._lock:
-            yield child
+        child._has_output_item_cache = self._has_output_item_cache
+        child._field_renames = self._field_renames
+        child._solution_keys = self._solution_keys
+        return child
 
     @contextlib.contextmanager
     def files(self) -> Iterator[List[Path]]:
@@ -509,49 +670,58 @@ class Instance(Model):
         """
 
         files: List[Path] = []
-        fragments: List[str] = []
-        data: Dict[str, Any] = {}
-
         inst: Optional["Instance"] = self
         while inst is not None:
-            for k, v in inst._data.items():
-                if isinstance(v, UnknownExpression) or k in data:
-                    fragments.append(f"{k} = {v};\n")
-                elif isinstance(v, EnumMeta):
-                    data[k] = [str(mem) for mem in v.__members__]
-                else:
-                    data[k] = v
-            fragments.extend(inst._code_fragments)
             files.extend(inst._includes)
-
+            inst = inst._parent
+        # Files generated for the parent instances are reused between their
+        # children
+        inst = self._parent
+        while inst is not None:
+            files.extend(inst._generated_files())
             inst = inst._parent
 
-        gen_files = []
+        gen_files: List[str] = []
         try:
-            if len(data) > 0:
-                file = tempfile.NamedTemporaryFile(
-                    prefix="mzn_data", suffix=".json", delete=False
-                )
-                gen_files.append(file)
-                file.write(
-                    json.dumps(data, cls=MZNJSONEncoder, ensure_ascii=False).encode()
+            gen_files = _write_instance_files(
+                _instance_file_contents(
+                    self._data, self._code_fragments, force=len(files) == 0
                 )
-                file.close()
-                files.append(Path(file.name))
-            if len(fragments) > 0 or len(files) == 0:
-                file = tempfile.NamedTemporaryFile(
-                    prefix="mzn_fragment", suffix=".mzn", delete=False
-                )
-                gen_files.append(file)
-                for code in fragments:
-                    file.write(code.encode())
-                file.close()
-                files.append(Path(file.name))
+            )
+            files.extend(Path(name) for name in gen_files)
             yield files
         finally:
-            for file in gen_files:
-                file.close()
-                os.remove(file.name)
+            for name in gen_files:
+                os.remove(name)
+
+    def _generated_files(self) -> List[Path]:
+        """Gets the generated files for the data and code of this instance
+
+        The data and code are encoded on every call, but the files are only
+        written again when their contents have changed (including values that
+        have been changed in place). The files are removed when the instance is
+        destroyed. Note that files of parent instances are not included.
+
+        Returns:
+            List of Path objects to the generated files
+        """
+        contents = _instance_file_contents(self._data, self._code_fragments)
+        digest = hashlib.blake2b()
+        for text in contents:
+            digest.update(b"-" if text is None else b"+" + text.encode())
+        version = digest.digest()
+        with _generated_files_lock:
+            if self._generated is None or self._generated[0] != version:
+                if self._generated is not None:
+                    # Remove the outdated files
+                    self._generated[2]()
+                names = _write_instance_files(contents)
+                self._generated = (
+                    version,
+                    [Path(name) for name in names],
+                    weakref.finalize(self, _remove_files, names),
+                )
+            return self._generated[1]
 
     @property
     def method(self) -> Method:
@@ -608,25 +778,44 @@ class Instance(Model):
         model such as the solving method, the input parameters, and the output
         parameters. The information found will be stored among the attributes
         of the instance.
+
+        The information is remembered for later instances of the same model.
+        Changes to the files added to the model are noticed by their
+        modification time and size, but changes to files that are included
+        from MiniZinc code are not. Use :meth:`clear_analysis_cache` after
+        changing such files.
         """
-        with self.files() as files:
-            assert len(files) > 0
-            output = self._driver._run(["--model-interface-only"] + files, self._solver)
-        interface = None
-        for obj in decode_json_stream(output.stdout):
-            if obj["type"] == "interface":
-                interface = obj
-                break
+        key = self._analysis_key()
+        with _analysis_cache_lock:
+            analysis = _analysis_cache.get(key)
+        if analysis is None:
+            with self.files() as files:
+                assert len(files) > 0
+                output = self._driver._run(
+                    ["--model-interface-only"] + files, self._solver
+                )
+            interface = None
+            for obj in decode_json_stream(output.stdout):
+                if obj["type"] == "interface":
+                    interface = obj
+                    break
+            analysis = (
+                Method.from_string(interface["method"]),
+                {k: _to_python_type(v) for k, v in interface["input"].items()},
+                {k: _to_python_type(v) for k, v in interface["output"].items()},
+                interface.get("has_output_item", True),
+            )
+            with _analysis_cache_lock:
+                _analysis_cache[key] = analysis
+                if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+                    _analysis_cache.popitem(last=False)
+
         old_method = self._method_cache
-        self._method_cache = Method.from_string(interface["method"])
-        self._input_cache = {}
-        for key, value in interface["input"].items():
-            self._input_cache[key] = _to_python_type(value)
         old_output = self._output_cache
-        self._output_cache = {}
-        for key, value in interface["output"].items():
-            self._output_cache[key] = _to_python_type(value)
-        self._has_output_item_cache = interface.get("has_output_item", True)
+        self._method_cache = analysis[0]
+        self._input_cache = dict(analysis[1])
+        self._output_cache = dict(analysis[2])
+        self._has_output_item_cache = analysis[3]
         if self._has_output_item_cache:
             self._output_cache["_output_item"] = str
         if self._checker:
@@ -637,23 +826,29 @@ class Instance(Model):
             and (self._output_cache != old_output or self._method_cache != old_method)
         ):
             fields = []
-            self._field_renames = []
+            required: List[str] = []
+            optional: List[str] = []
+            self._field_renames = {}
             if (
                 self._method_cache is not Method.SATISFY
                 and "objective" not in self._output_cache
             ):
                 fields.append(("objective", Number))
+                required.append("objective")
             for k, v in self._output_cache.items():
                 if k in ["_output_item", "_checker"]:
                     fields.append((k, str, field(default="")))
-                elif iskeyword(k):
+                    optional.append(k)
+                    continue
+                required.append(k)
+                if iskeyword(k):
                     warnings.warn(
                         f"MiniZinc field '{k}' is a Python keyword. It has been "
                         f"renamed to 'mzn_{k}'",
                         SyntaxWarning,
                         stacklevel=1,
                     )
-                    self._field_renames.append((k, "mzn_" + k))
+                    self._field_renames[k] = "mzn_" + k
                     fields.append(("mzn_" + k, v))
                 else:
                     fields.append((k, v))
@@ -679,6 +874,57 @@ class Instance(Model):
                 namespace=methods,
                 frozen=True,
             )
+            self._solution_keys = (
+                self.output_type,
+                tuple(required),
+                tuple(optional),
+                frozenset(required + optional),
+            )
+
+    @staticmethod
+    def clear_analysis_cache():
+        """Forget the information remembered by :meth:`analyse`
+
+        Later calls of :meth:`analyse` will query MiniZinc again, even for
+        models that have been analysed before.
+        """
+        with _analysis_cache_lock:
+            _analysis_cache.clear()
+
+    def _analysis_key(self) -> bytes:
+        """Fingerprint of everything that influences the model interface
+
+        The key covers the included files (including their modification
+        time, but not the files they include in turn), the code fragments, the
+        names of the assigned parameters, the solver configuration, and the
+        driver. The values assigned to parameters are only included when they
+        are written as MiniZinc code, as other values cannot change the
+        interface of the model.
+        """
+        key = hashlib.blake2b()
+        key.update(
+            repr(
+                (
+                    str(self._driver.executable),
+                    self._solver._identifier,
+                    self._solver.output_configuration(),
+                )
+            ).encode()
+        )
+        inst: Optional["Instance"] = self
+        while inst is not None:
+            for file in inst._includes:
+                stat = file.stat()
+                key.update(repr((str(file), stat.st_mtime_ns, stat.st_size)).encode())
+            for code in inst._code_fragments:
+                key.update(repr(code).encode())
+            for k, v in inst._data.items():
+                if isinstance(v, UnknownExpression):
+                    key.update(repr((k, v)).encode())
+                else:
+                    key.update(repr(k).encode())
+            inst = inst._parent
+        return key.digest()
 
     def _reset_analysis(self):
         self._method_cache = None
@@ -741,14 +987,7 @@ class Instance(Model):
         if optimisation_level is not None:
             cmd.extend(["-O", str(optimisation_level)])
 
-        for flag, value in kwargs.items():
-            if not flag.startswith("-"):
-                flag = f"--{flag}"
-            if isinstance(value, bool):
-                if value:
-                    cmd.append(flag)
-            else:
-                cmd.extend([flag, value])
+        cmd.extend(_kwargs_to_argv(kwargs))
 
         # Add files as last arguments
         with self.files() as files:
@@ -757,9 +996,8 @@ class Instance(Model):
             output = self._driver._run(cmd, solver=self._solver)
 
         statistics: Dict[str, Any] = {}
-        matches = re.findall(rb"%%%mzn-stat:? (\w*)=([^\r\n]*)", output.stdout)
-        for m in matches:
-            set_stat(statistics, m[0].decode(), m[1].decode())
+        for m in _STAT_RE.finditer(output.stdout):
+            set_stat(statistics, m[1].decode(), m[2].decode())
 
         try:
             yield fzn, ozn, statistics
@@ -776,37 +1014,78 @@ class Instance(Model):
         return super().add_string(code)
 
     def _parse_stream_obj(self, obj, statistics):
+        handler = self._stream_obj_handlers.get(obj["type"])
+        if handler is None:
+            return None, None, statistics
+        return handler(self, obj, statistics)
+
+    def _parse_solution_obj(self, obj, statistics):
+        tmp = obj["output"]["json"]
+        if "_objective" in tmp:
+            tmp["objective"] = tmp.pop("_objective")
+        if "_output" in tmp:
+            tmp["_output_item"] = tmp.pop("_output")
+        if "_checker" in statistics:
+            tmp["_checker"] = statistics.pop("_checker")
+
+        keys = self._solution_keys
         solution = None
-        status = None
-        if obj["type"] == "solution":
-            tmp = obj["output"]["json"]
-            if "_objective" in tmp:
-                tmp["objective"] = tmp.pop("_objective")
-            if "_output" in tmp:
-                tmp["_output_item"] = tmp.pop("_output")
-            for before, after in self._field_renames:
-                tmp[after] = tmp.pop(before)
-
-            if "_checker" in statistics:
-                tmp["_checker"] = statistics.pop("_checker")
-
+        if keys is not None and keys[0] is self.output_type and keys[3].issuperset(tmp):
+            # Generated solution types take their fields positionally, in the
+            # order of the MiniZinc output, which also avoids renaming keys.
+            # Unexpected output falls back on the keyword arguments below.
+            with contextlib.suppress(KeyError):
+                solution = self.output_type(
+                    *[tmp[k] for k in keys[1]], *[tmp.get(k, "") for k in keys[2]]
+                )
+        if solution is None:
+            if self._field_renames:
+                tmp = {self._field_renames.get(k, k): v for k, v in tmp.items()}
             solution = self.output_type(**tmp)
+        if "time" in obj:
             statistics["time"] = timedelta(milliseconds=obj["time"])
-        elif obj["type"] == "time":
-            statistics["time"] = timedelta(milliseconds=obj["time"])
-        elif obj["type"] == "statistics":
-            for key, val in obj["statistics"].items():
-                set_stat(statistics, key, str(val))
-        elif obj["type"] == "status":
-            status = Status.from_str(obj["status"])
-        elif obj["type"] == "checker":
-            if "raw" in obj["output"]:
-                statistics["_checker"] = obj["output"]["raw"]
-            else:
-                # TODO: can we ensure this is made JSON?
-                statistics["_checker"] = obj["output"]["dzn"]
+        return solution, None, statistics
+
+    def _parse_time_obj(self, obj, statistics):
+        statistics["time"] = timedelta(milliseconds=obj["time"])
+        return None, None, statistics
+
+    def _parse_statistics_obj(self, obj, statistics):
+        for key, val in obj["statistics"].items():
+            set_stat(statistics, key, str(val))
+        return None, None, statistics
+
+    def _parse_status_obj(self, obj, statistics):
+        return None, _STATUS_MAP.get(obj["status"]), statistics
 
-        return solution, status, statistics
+    def _parse_checker_obj(self, obj, statistics):
+        if "raw" in obj["output"]:
+            statistics["_checker"] = obj["output"]["raw"]
+        else:
+            # TODO: can we ensure this is made JSON?
+            statistics["_checker"] = obj["output"]["dzn"]
+        return None, None, statistics
+
+    # Parsing method for every type of object in the MiniZinc JSON stream
+    _stream_obj_handlers = {
+        "solution": _parse_solution_obj,
+        "time": _parse_time_obj,
+        "statistics": _parse_statistics_obj,
+        "status": _parse_status_obj,
+        "checker": _parse_checker_obj,
+    }
+
+
+# Python types of the base types reported by the MiniZinc model interface
+_BASETYPE_MAP: Dict[str, type] = {
+    "bool": bool,
+    "float": float,
+    "int": int,
+    "string": str,
+    "ann": str,
+    "tuple": list,
+    "record": dict,
+}
 
 
 def _to_python_type(mzn_type: dict) -> Type:
@@ -824,23 +1103,9 @@ def _to_python_type(mzn_type: dict) -> Type:
 
     """
     basetype = mzn_type["type"]
-    pytype: Type
     # TODO: MiniZinc does not report enumerated types correctly
-    if basetype == "bool":
-        pytype = bool
-    elif basetype == "float":
-        pytype = float
-    elif basetype == "int":
-        pytype = int
-    elif basetype == "string":
-        pytype = str
-    elif basetype == "ann":
-        pytype = str
-    elif basetype == "tuple":
-        pytype = list
-    elif basetype == "record":
-        pytype = dict
-    else:
+    pytype = _BASETYPE_MAP.get(basetype)
+    if pytype is None:
         warnings.warn(
             f"Unable to determine minizinc type `{basetype}` assuming integer type",
             FutureWarning,
@@ -848,26 +1113,168 @@ def _to_python_type(mzn_type: dict) -> Type:
         )
         pytype = int
 
-    if mzn_type.get("set", False):
+    return _wrap_type(pytype, mzn_type.get("set", False), mzn_type.get("dim", 0))
+
+
+@functools.lru_cache(maxsize=None)
+def _wrap_type(pytype: type, is_set: bool, dim: int) -> Type:
+    # Model interfaces tend to repeat the same few types, so the (slow) typing
+    # subscriptions are only done once for every combination
+    if is_set:
         if pytype is int:
             pytype = Union[Set[int], range]  # type: ignore
         else:
             pytype = Set[pytype]  # type: ignore
 
-    dim = mzn_type.get("dim", 0)
-    while dim >= 1:
-        # No typing support for n-dimensional typing
+    # No typing support for n-dimensional typing
+    for _ in range(dim):
         pytype = List[pytype]  # type: ignore
-        dim -= 1
     return pytype
 
 
-async def _read_all(stream: asyncio.StreamReader):
-    output: bytes = b""
-    while not stream.at_eof():
-        try:
-            output += await stream.read()
-            return output
-        except asyncio.LimitOverrunError as err:
-            output += await stream.readexactly(err.consumed)
-    return output
+def _kwargs_to_argv(kwargs: Dict[str, Any]) -> List[Any]:
+    """Convert keyword arguments into command line arguments for MiniZinc
+
+    The leading ``--`` can be omitted from the name of a flag. Boolean values
+    signify the occurrence of the flag, other values are passed as the
+    argument of the flag.
+
+    Args:
+        kwargs (Dict[str, Any]): keyword arguments given to a method
+
+    Returns:
+        List[Any]: command line arguments in the order of the keyword arguments
+
+    """
+    argv: List[Any] = []
+    for flag, value in kwargs.items():
+        if not flag.startswith("-"):
+            flag = f"--{flag}"
+        if isinstance(value, bool):
+            if value:
+                argv.append(flag)
+        else:
+            argv.append(flag)
+            argv.append(value)
+    return argv
+
+
+def _instance_file_contents(
+    data: Dict[str, Any], code_fragments: List[str], force: bool = False
+) -> Tuple[Optional[str], Optional[str]]:
+    """Encode the data and code of an instance as the contents of files
+
+    Data is encoded as JSON. Code fragments, and data that can only be
+    expressed in MiniZinc, are combined as MiniZinc code.
+
+    Args:
+        data (Dict[str, Any]): The data assigned in the instance.
+        code_fragments (List[str]): The code added to the instance.
+        force (bool): Create (possibly empty) MiniZinc code, even if there is
+            no code.
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: The contents of the JSON file and
+        the MiniZinc file, or None when the file is not required.
+    """
+    fragments: List[str] = []
+    json_data: Dict[str, Any] = {}
+    for k, v in data.items():
+        if isinstance(v, UnknownExpression):
+            fragments.append(f"{k} = {v};\n")
+        elif isinstance(v, EnumMeta):
+            json_data[k] = [str(mem) for mem in v.__members__]
+        else:
+            json_data[k] = v
+    fragments.extend(code_fragments)
+
+    json_text = _DATA_ENCODER.encode(json_data) if len(json_data) > 0 else None
+    mzn_text = None
+    if len(fragments) > 0 or (force and json_text is None):
+        mzn_text = "".join(fragments)
+    return json_text, mzn_text
+
+
+def _write_instance_files(contents: Tuple[Optional[str], Optional[str]]) -> List[str]:
+    """Write the contents of the files of an instance to temporary files
+
+    Args:
+        contents (Tuple[Optional[str], Optional[str]]): The contents of the
+            JSON file and the MiniZinc file, as given by
+            :func:`_instance_file_contents`.
+
+    Returns:
+        List[str]: The names of the files that were written.
+    """
+    json_text, mzn_text = contents
+    names: List[str] = []
+    try:
+        if json_text is not None:
+            fd, name = tempfile.mkstemp(prefix="mzn_data", suffix=".json")
+            names.append(name)
+            try:
+                _write_text(fd, json_text)
+            finally:
+                os.close(fd)
+        if mzn_text is not None:
+            fd, name = tempfile.mkstemp(prefix="mzn_fragment", suffix=".mzn")
+            names.append(name)
+            try:
+                _write_text(fd, mzn_text)
+            finally:
+                os.close(fd)
+    except BaseException:
+        _remove_files(names)
+        raise
+    return names
+
+
+def _remove_files(names: List[str]):
+    for name in names:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(name)
+
+
+def _write_text(fd: int, text: str, chunk_size: int = 1 << 20):
+    """Write text to a file descriptor using UTF-8 encoding
+
+    The text is encoded in chunks, so that no encoded copy of the full text has
+    to be kept in memory.
+    """
+    for i in range(0, len(text), chunk_size):
+        _write_all(fd, text[i : i + chunk_size].encode())
+
+
+def _write_all(fd: int, data: bytes):
+    """Write all data to a file descriptor, which os.write does not guarantee"""
+    view = memoryview(data)
+    while len(view) > 0:
+        view = view[os.write(fd, view) :]
+
+
+async def _read_tail(stream: asyncio.StreamReader, size: int) -> bytes:
+    """Read a stream until its end, only keeping (at most) the last size bytes"""
+    chunks: Deque[bytes] = deque()
+    total = 0
+    while True:
+        chunk = await stream.read(1 << 16)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        total += len(chunk)
+        while total - len(chunks[0]) >= size:
+            total -= len(chunks.popleft())
+    if total <= size:
+        return b"".join(chunks)
+    tail = b"".join(chunks)[-size:]
+    # Do not start halfway through a UTF-8 encoded character
+    start = 0
+    while start < len(tail) and tail[start] & 0xC0 == 0x80:
+        start += 1
+    return tail[start:]
+
+
+async def _read_all(stream: asyncio.StreamReader) -> bytes:
+    # Reading without a size drains the stream until EOF and joins the
+    # received blocks once. (The stream limit only applies to readuntil.)
+    return await stream.read()
@@ -3,9 +3,11 @@
 #  file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import asyncio
+import re
 import warnings
 from enum import Enum
-from json import JSONDecodeError, JSONDecoder, JSONEncoder, loads
+from json import JSONDecodeError, JSONDecoder, JSONEncoder
+from typing import Any, Callable, Dict, List
 
 from .error import MiniZincError, MiniZincWarning, error_from_stream_obj
 from .types import AnonEnum, ConstrEnum
@@ -15,23 +17,63 @@ try:
 except ImportError:
     numpy = None
 
+# Whitespace allowed between JSON values
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+
+def _encode_enum(o):
+    return {"e": o.name}
+
+
+def _encode_anon_enum(o):
+    return {"e": o.enumName, "i": o.value}
+
+
+def _encode_constr_enum(o):
+    return {"c": o.constructor, "e": o.argument}
+
+
+def _encode_set(o):
+    if isinstance(o, range) and o.step == 1:
+        # Use MiniZinc's range notation instead of listing every element
+        return {"set": [[o.start, o.stop - 1]] if len(o) > 0 else []}
+    return {"set": [{"e": i.name} if isinstance(i, Enum) else i for i in o]}
+
+
+def _find_encoder(o):
+    if isinstance(o, Enum):
+        return _encode_enum
+    if isinstance(o, AnonEnum):
+        return _encode_anon_enum
+    if isinstance(o, ConstrEnum):
+        return _encode_constr_enum
+    if isinstance(o, set) or isinstance(o, range):
+        return _encode_set
+    if numpy is not None:
+        if isinstance(o, numpy.ndarray):
+            return numpy.ndarray.tolist
+        if isinstance(o, numpy.generic):
+            return numpy.generic.item
+    return None
+
+
+# Encoding functions of the types encountered by MZNJSONEncoder. The table is
+# cleared when it is full, as enumerated types are often created dynamically.
+_ENCODERS_SIZE = 256
+_encoders: Dict[type, Callable[[Any], Any]] = {}
+
 
 class MZNJSONEncoder(JSONEncoder):
     def default(self, o):
-        if isinstance(o, Enum):
-            return {"e": o.name}
-        if isinstance(o, AnonEnum):
-            return {"e": o.enumName, "i": o.value}
-        if isinstance(o, ConstrEnum):
-            return {"c": o.constructor, "e": o.argument}
-        if isinstance(o, set) or isinstance(o, range):
-            return {"set": [{"e": i.name} if isinstance(i, Enum) else i for i in o]}
-        if numpy is not None:
-            if isinstance(o, numpy.ndarray):
-                return o.tolist()
-            if isinstance(o, numpy.generic):
-                return o.item()
-        return super().default(o)
+        encode = _encoders.get(type(o))
+        if encode is None:
+            encode = _find_encoder(o)
+            if encode is None:
+                return super().default(o)
+            if len(_encoders) >= _ENCODERS_SIZE:
+                _encoders.clear()
+            _encoders[type(o)] = encode
+        return encode(o)
 
 
 class MZNJSONDecoder(JSONDecoder):
@@ -57,65 +99,89 @@ class MZNJSONDecoder(JSONDecoder):
     def mzn_object_hook(self, obj):
         if isinstance(obj, dict):
             if len(obj) == 1 and "set" in obj:
-                li = []
+                result = set()
+                # The JSON parser only creates plain lists and dicts
                 for item in obj["set"]:
-                    if isinstance(item, list):
+                    if type(item) is list:
                         assert len(item) == 2
-                        li.extend(list(range(item[0], item[1] + 1)))
-                    elif isinstance(item, dict):
-                        li.append(self.transform_enum_object(item))
+                        result.update(range(item[0], item[1] + 1))
+                    elif type(item) is dict:
+                        result.add(self.transform_enum_object(item))
                     else:
-                        li.append(item)
-                return set(li)
+                        result.add(item)
+                return result
             else:
                 return self.transform_enum_object(obj)
         return obj
 
 
+def _skip_whitespace(text: str, pos: int) -> int:
+    match = _WHITESPACE.match(text, pos)
+    assert match is not None
+    return match.end()
+
+
 def decode_json_stream(byte_stream: bytes, cls=None, **kw):
-    for line in byte_stream.split(b"\n"):
-        line = line.strip()
-        if line != b"":
-            try:
-                obj = loads(line, cls=cls, **kw)
-            except JSONDecodeError as e:
-                raise MiniZincError(
-                    message=f"MiniZinc driver output a message that cannot be parsed as JSON:\n{repr(line)}"
-                ) from e
-            if obj["type"] == "warning" or (
-                obj["type"] == "error" and obj["what"] == "warning"
-            ):
-                # TODO: stack trace and location
-                warnings.warn(obj["message"], MiniZincWarning, stacklevel=1)
-            elif obj["type"] == "error":
-                raise error_from_stream_obj(obj)
-            else:
-                yield obj
+    decoder = (JSONDecoder if cls is None else cls)(**kw)
+    # Decode the objects in place, without splitting the stream into lines
+    text = byte_stream.decode()
+    pos = _skip_whitespace(text, 0)
+    while pos < len(text):
+        try:
+            obj, end = decoder.raw_decode(text, pos)
+        except JSONDecodeError as e:
+            line_end = text.find("\n", pos)
+            line = text[pos : len(text) if line_end < 0 else line_end]
+            raise MiniZincError(
+                message=f"MiniZinc driver output a message that cannot be parsed as JSON:\n{repr(line.strip().encode())}"
+            ) from e
+        pos = _skip_whitespace(text, end)
+        kind = obj["type"]
+        if kind != "error" and kind != "warning":
+            yield obj
+        elif kind == "warning" or obj["what"] == "warning":
+            # TODO: stack trace and location
+            warnings.warn(obj["message"], MiniZincWarning, stacklevel=1)
+        else:
+            raise error_from_stream_obj(obj)
 
 
 async def decode_async_json_stream(stream: asyncio.StreamReader, cls=None, **kw):
-    buffer: bytes = b""
+    # The same decoder is used for all lines
+    decoder = (JSONDecoder if cls is None else cls)(**kw)
+    # Parts of a line that exceeded the limit of the stream reader
+    partial: List[bytes] = []
     while not stream.at_eof():
         try:
-            buffer += await stream.readuntil(b"\n")
-            buffer = buffer.strip()
-            if buffer == b"":
+            line = await stream.readuntil(b"\n")
+            if partial:
+                partial.append(line)
+                line = b"".join(partial)
+                partial = []
+            line = line.strip()
+            if line == b"":
                 continue
             try:
-                obj = loads(buffer, cls=cls, **kw)
+                obj = decoder.decode(line.decode())
             except JSONDecodeError as e:
                 raise MiniZincError(
-                    message=f"MiniZinc driver output a message that cannot be parsed as JSON:\n{repr(buffer)}"
+                    message=f"MiniZinc driver output a message that cannot be parsed as JSON:\n{repr(line)}"
                 ) from e
-            if obj["type"] == "warning" or (
-                obj["type"] == "error" and obj["what"] == "warning"
-            ):
+            kind = obj["type"]
+            if kind != "error" and kind != "warning":
+                yield obj
+            elif kind == "warning" or obj["what"] == "warning":
                 # TODO: stack trace and location
                 warnings.warn(obj["message"], MiniZincWarning, stacklevel=1)
-            elif obj["type"] == "error":
-                raise error_from_stream_obj(obj)
             else:
-                yield obj
-            buffer = b""
+                raise error_from_stream_obj(obj)
         except asyncio.LimitOverrunError as err:
-            buffer += await stream.readexactly(err.consumed)
+            partial.append(await stream.readexactly(err.consumed))
+        except asyncio.IncompleteReadError as err:
+            # Include the parts of the line that were already read
+            if partial:
+                partial.append(err.partial)
+                raise asyncio.IncompleteReadError(b"".join(partial), None) from err
+            raise
+    if partial:
+        raise asyncio.IncompleteReadError(b"".join(partial), None)
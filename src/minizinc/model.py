@@ -7,7 +7,7 @@ import threading
 import warnings
 from enum import Enum, EnumMeta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 ParPath = Union[Path, str]
 
@@ -35,22 +35,35 @@ class Method(Enum):
         Returns:
             Method: Method represented by s
         """
-        if s == "sat":
-            return cls.SATISFY
-        elif s == "min":
-            return cls.MINIMIZE
-        elif s == "max":
-            return cls.MAXIMIZE
-        else:
+        try:
+            return _METHOD_MAP[s]
+        except KeyError:
             raise ValueError(
                 f"Unknown Method {s}, valid options are 'sat', 'min', or 'max'"
-            )
+            ) from None
+
+
+# Method strings used in the model interface of MiniZinc
+_METHOD_MAP: Dict[str, Method] = {
+    "sat": Method.SATISFY,
+    "min": Method.MINIMIZE,
+    "max": Method.MAXIMIZE,
+}
 
 
 class UnknownExpression(str):
     pass
 
 
+def _reassignment_error(key: str) -> AssertionError:
+    # TODO: Fix the error type and document
+    return AssertionError(
+        f"The parameter '{key}' cannot be assigned multiple values. "
+        f"If you are changing the model, consider using the branch "
+        f"method before assigning the parameter."
+    )
+
+
 class Model:
     """The representation of a MiniZinc model in Python
 
@@ -101,18 +114,36 @@ class Model:
             value (Any): Value to be assigned to the parameter.
         """
         with self._lock:
-            if self._data.get(key, None) is None:
-                if isinstance(value, EnumMeta):
-                    self._register_enum_values(value)
-                self._data.__setitem__(key, value)
-            else:
-                if self._data[key] != value:
-                    # TODO: Fix the error type and document
-                    raise AssertionError(
-                        f"The parameter '{key}' cannot be assigned multiple values. "
-                        f"If you are changing the model, consider using the branch "
-                        f"method before assigning the parameter."
-                    )
+            self._set_unlocked(key, value)
+
+    def _bulk_set(self, data: Dict[str, Any]):
+        """Set multiple parameters of the Model at once.
+
+        All assignments are checked before any of them is made, after which
+        the parameters are set using a single dictionary update. Only the
+        parameters that were already assigned are checked individually.
+
+        Args:
+            data (Dict[str, Any]): Mapping from the identifiers of parameters
+                to the values to be assigned to them. The values are expected
+                to be data parsed from a file, enumerated types have to be
+                assigned using ``__setitem__``.
+        """
+        with self._lock:
+            for key in self._data.keys() & data.keys():
+                if self._data[key] is not None and self._data[key] != data[key]:
+                    raise _reassignment_error(key)
+            self._data.update(data)
+
+    def _set_unlocked(self, key: str, value: Any):
+        # Parameters assigned None are still considered to be unassigned
+        existing = self._data.get(key)
+        if existing is None:
+            if isinstance(value, EnumMeta):
+                self._register_enum_values(value)
+            self._data[key] = value
+        elif existing != value:
+            raise _reassignment_error(key)
 
     def _register_enum_values(self, t: EnumMeta):
         for name in t.__members__:
@@ -153,6 +184,7 @@ class Model:
                 within Python. This option is ignored if the extra `dzn` is
                 not enabled.
         Raises:
+            FileNotFoundError: when the file does not exist.
             MiniZincError: when an error occurs during the parsing or
                 type checking of the model object.
         """
@@ -161,38 +193,18 @@ class Model:
     def _add_file(self, file: ParPath, parse_data: bool = False) -> None:
         if not isinstance(file, Path):
             file = Path(file)
-        assert file.exists()
-        if not parse_data:
+        load = _DATA_LOADERS.get(file.suffix) if parse_data else None
+        # Loading the data fails by itself when the file does not exist
+        data = load(file) if load is not None else None
+        if data is not None:
+            self._bulk_set(data)
+        elif not file.exists():
+            raise FileNotFoundError(f"No such file: '{file}'")
+        elif not parse_data or load is not None:
             with self._lock:
                 self._includes.append(file)
-            return
-        if file.suffix == ".json":
-            data = json.load(file.open())
-            for k, v in data.items():
-                self.__setitem__(k, v)
-        elif file.suffix == ".dzn" and parse_data:
-            try:
-                from lark.exceptions import LarkError
-
-                from .dzn import parse_dzn
-
-                try:
-                    data = parse_dzn(file)
-                    for k, v in data.items():
-                        self.__setitem__(k, v)
-                except LarkError:
-                    warnings.warn(
-                        f"Could not parse {file}. Parameters included within this file "
-                        f"are not available in Python",
-                        stacklevel=1,
-                    )
-                    with self._lock:
-                        self._includes.append(file)
-            except ImportError:
-                with self._lock:
-                    self._includes.append(file)
-        elif file.suffix not in [".dzn", ".mzn", ".mzc"]:
-            raise NameError("Unknown file suffix %s", file.suffix)
+        elif file.suffix not in (".mzn", ".mzc"):
+            raise NameError(f"Unknown file suffix {file.suffix}")
         else:
             with self._lock:
                 if ".mzc" in file.suffixes:
@@ -213,7 +225,40 @@ class Model:
 
     def __copy__(self):
         copy = self.__class__()
-        copy._includes = self._includes[:]
-        copy._code_fragments = self._code_fragments[:]
-        copy._data = dict.copy(self._data)
+        copy.__dict__.update(
+            _includes=self._includes.copy(),
+            _code_fragments=self._code_fragments.copy(),
+            _data=self._data.copy(),
+            _enum_map=self._enum_map.copy(),
+        )
         return copy
+
+
+def _load_json(file: Path) -> Optional[Dict[str, Any]]:
+    return json.loads(file.read_bytes())
+
+
+def _load_dzn(file: Path) -> Optional[Dict[str, Any]]:
+    try:
+        from lark.exceptions import LarkError
+
+        from .dzn import parse_dzn
+    except ImportError:
+        return None
+    try:
+        return parse_dzn(file)
+    except LarkError:
+        warnings.warn(
+            f"Could not parse {file}. Parameters included within this file "
+            f"are not available in Python",
+            stacklevel=1,
+        )
+        return None
+
+
+# Functions to parse the data of the file types that can be used from Python.
+# A loader returns None when the file has to be included in the model instead.
+_DATA_LOADERS: Dict[str, Callable[[Path], Optional[Dict[str, Any]]]] = {
+    ".json": _load_json,
+    ".dzn": _load_dzn,
+}
@@ -179,22 +179,7 @@ class Status(Enum):
 
     @classmethod
     def from_str(cls, status: str):
-        s = None
-        if status == "ERROR":
-            s = cls.ERROR
-        elif status == "UNKNOWN":
-            s = cls.UNKNOWN
-        elif status == "UNBOUNDED" or status == "UNSAT_OR_UNBOUNDED":
-            s = cls.UNBOUNDED
-        elif status == "UNSATISFIABLE":
-            s = cls.UNSATISFIABLE
-        elif status == "SATISFIED":
-            s = cls.SATISFIED
-        elif status == "ALL_SOLUTIONS":
-            s = cls.ALL_SOLUTIONS
-        elif status == "OPTIMAL_SOLUTION":
-            s = cls.OPTIMAL_SOLUTION
-        return s
+        return _STATUS_MAP.get(status)
 
     def __str__(self):
         return self.name
@@ -206,6 +191,11 @@ class Status(Enum):
         return False
 
 
+# Status strings used in the JSON stream of MiniZinc
+_STATUS_MAP: Dict[str, Status] = {s.name: s for s in Status}
+_STATUS_MAP["UNSAT_OR_UNBOUNDED"] = Status.UNBOUNDED
+
+
 @dataclass
 class Result:
     """Representation of a MiniZinc solution in Python
@@ -3,12 +3,15 @@
 #  file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import warnings
+from copy import copy
+from pathlib import Path
 
+import pytest
 from support import InstanceTestCase
 
 from minizinc import Method, Solver, Status
 from minizinc.error import MiniZincWarning
-from minizinc.helpers import check_result, check_solution
+from minizinc.helpers import _check_key, check_result, check_solution
 
 
 class CheckResults(InstanceTestCase):
@@ -44,6 +47,16 @@ class CheckResults(InstanceTestCase):
             self.instance, result, self.other_solver, range(len(result.solution))
         )
 
+    def test_check_all_incorrect(self):
+        result = self.instance.solve(all_solutions=True)
+        assert len(result.solution) > 2
+        result.solution[1] = self.instance.output_type(x=[2, 1])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", MiniZincWarning)
+            assert not check_result(
+                self.instance, result, self.other_solver, range(len(result.solution))
+            )
+
     def test_check_specific(self):
         assert self.instance.method == Method.SATISFY
         result = self.instance.solve(nr_solutions=5)
@@ -54,6 +67,41 @@ class CheckResults(InstanceTestCase):
             self.instance, {"x": [5, 6]}, Status.SATISFIED, self.other_solver
         )
 
+    def test_no_cache(self):
+        assert check_solution(
+            self.instance,
+            {"x": [5, 6]},
+            Status.SATISFIED,
+            self.other_solver,
+            use_cache=False,
+        )
+
+    def test_check_key(self):
+        numpy = pytest.importorskip("numpy")
+
+        def key(solution, driver=self.instance._driver):
+            return _check_key(
+                self.instance,
+                solution,
+                Status.SATISFIED,
+                self.other_solver,
+                None,
+                driver,
+            )
+
+        # The representation of these arrays would be truncated
+        a = numpy.zeros(2000, dtype=int)
+        b = a.copy()
+        b[1000] = 1
+        key_a = key({"x": a})
+        assert key_a is not None and key_a != key({"x": b})
+        # Outcomes are not shared between MiniZinc executables
+        other = copy(self.instance._driver)
+        other._executable = Path("/other/minizinc")
+        assert key_a != key({"x": a}, other)
+        self.instance["n"] = 1
+        assert key_a != key({"x": a})
+
     def test_enum(self):
         self.instance.add_string("""enum Foo = {A, B};var Foo: f;""")
         result = self.instance.solve()
@@ -12,3 +12,14 @@ def test_default_driver():
 def test_version():
     # Test normal behaviour
     assert "MiniZinc" in minizinc.default_driver.minizinc_version
+
+
+def test_which_in_dirs(tmp_path):
+    from minizinc.driver import _which_in_dirs
+
+    exe = tmp_path / "minizinc"
+    exe.write_text("")
+    assert _which_in_dirs("minizinc", [str(tmp_path)]) is None
+    exe.chmod(0o755)
+    assert _which_in_dirs("minizinc", [str(tmp_path)] * 2) == str(exe)
+    assert _which_in_dirs("minizinc", [str(tmp_path / "missing")]) is None
@@ -2,13 +2,19 @@
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+import asyncio
+import json
+import tempfile
 import warnings
+from pathlib import Path
 
 import pytest
 from support import InstanceTestCase
 
 import minizinc
-from minizinc.error import MiniZincWarning
+from minizinc import Instance, Model
+from minizinc.error import MiniZincWarning, parse_error
+from minizinc.instance import _kwargs_to_argv, _read_tail
 from minizinc.result import Status
 
 
@@ -98,3 +104,87 @@ class TestBranch(InstanceTestCase):
                     assert len(w) == 1
                     assert issubclass(w[-1].category, MiniZincWarning)
                     assert "model inconsistency" in str(w[-1].message)
+
+
+class TestBranchData(InstanceTestCase):
+    code = """
+        int: n;
+        var 1..10: x;
+        constraint x = n;
+    """
+
+    def branch_data(self):
+        data = {}
+        with self.instance.branch() as child:
+            with child.files() as files:
+                for file in files:
+                    if file.suffix == ".json":
+                        data.update(json.loads(file.read_text()))
+        return data
+
+    def test_assign_unset(self):
+        self.instance["n"] = None
+        assert self.branch_data() == {"n": None}
+        self.instance["n"] = 5
+        assert self.branch_data() == {"n": 5}
+        with self.instance.branch() as child:
+            result = child.solve()
+            assert result.solution.x == 5
+
+    def test_change_in_place(self):
+        values = [1, 2, 3]
+        self.instance["n"] = 1
+        self.instance["values"] = values
+        assert self.branch_data()["values"] == [1, 2, 3]
+        # Changes made between branches must reach the next branch
+        values[0] = 99
+        assert self.branch_data()["values"] == [99, 2, 3]
+
+
+class TestAnalysisCache(InstanceTestCase):
+    def test_clear_transitive_include(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            lib = Path(tmp, "lib.mzn")
+            lib.write_text("var 1..3: x;")
+            main = Path(tmp, "main.mzn")
+            main.write_text('include "lib.mzn";')
+            assert "x" in Instance(self.solver, Model(main)).output
+            lib.write_text("var 1..3: y;")
+            Instance.clear_analysis_cache()
+            output = Instance(self.solver, Model(main)).output
+            assert "y" in output and "x" not in output
+
+
+class TestKwargsToArgv:
+    def test_empty(self):
+        assert _kwargs_to_argv({}) == []
+
+    def test_flags(self):
+        assert _kwargs_to_argv(
+            {"solver-statistics": True, "verbose-solving": False, "-s": 3, "fzn": "x"}
+        ) == ["--solver-statistics", "-s", 3, "--fzn", "x"]
+
+
+class TestReadTail:
+    def read_tail(self, data: bytes, size: int) -> bytes:
+        async def run():
+            stream = asyncio.StreamReader()
+            stream.feed_data(data)
+            stream.feed_eof()
+            return await _read_tail(stream, size)
+
+        return asyncio.run(run())
+
+    def test_short(self):
+        assert self.read_tail(b"MiniZinc: type error: boom\n", 1024) == (
+            b"MiniZinc: type error: boom\n"
+        )
+
+    def test_multibyte_cut(self):
+        message = b"MiniZinc: type error: boom\n"
+        # The cut falls in the middle of the last check mark
+        tail = self.read_tail("\u2713".encode() * 10 + message, len(message) + 2)
+        assert tail == message
+        error = parse_error(tail)
+        assert isinstance(error, minizinc.error.TypeError)
+        assert "boom" in str(error)
@@ -0,0 +1,102 @@
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import asyncio
+import json
+
+import pytest
+
+from minizinc.error import MiniZincError
+from minizinc.json import (
+    MZNJSONDecoder,
+    MZNJSONEncoder,
+    decode_async_json_stream,
+    decode_json_stream,
+)
+
+
+def test_encode_range():
+    assert json.loads(json.dumps(range(2, 6), cls=MZNJSONEncoder)) == {"set": [[2, 5]]}
+    assert json.loads(json.dumps(range(-3, -2), cls=MZNJSONEncoder)) == {
+        "set": [[-3, -3]]
+    }
+
+
+def test_encode_empty_range():
+    assert json.loads(json.dumps(range(5, 5), cls=MZNJSONEncoder)) == {"set": []}
+    assert json.loads(json.dumps(range(5, 1), cls=MZNJSONEncoder)) == {"set": []}
+
+
+def test_encode_step_range():
+    assert json.loads(json.dumps(range(1, 8, 3), cls=MZNJSONEncoder)) == {
+        "set": [1, 4, 7]
+    }
+    assert json.loads(json.dumps(range(3, 0, -1), cls=MZNJSONEncoder)) == {
+        "set": [3, 2, 1]
+    }
+
+
+def test_range_round_trip():
+    encoded = json.dumps({"x": range(2, 6)}, cls=MZNJSONEncoder)
+    assert json.loads(encoded, cls=MZNJSONDecoder) == {"x": {2, 3, 4, 5}}
+
+
+def test_decode_stream():
+    stream = b'{"type": "a"}\n\n  {"type": "b"}{"type": "c"}\r\n{"type": "d"}'
+    assert [obj["type"] for obj in decode_json_stream(stream)] == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+
+
+def test_decode_stream_partial():
+    stream = b'{"type": "a"}\n{"type": "b", "x": [1,\n'
+    objs = decode_json_stream(stream)
+    assert next(objs) == {"type": "a"}
+    with pytest.raises(MiniZincError, match="cannot be parsed as JSON") as err:
+        next(objs)
+    assert repr(b'{"type": "b", "x": [1,') in str(err.value)
+
+
+def test_decode_stream_whitespace():
+    # Only the whitespace allowed by JSON may separate objects
+    with pytest.raises(MiniZincError):
+        list(decode_json_stream('{"type": "a"}\u2003{"type": "b"}'.encode()))
+
+
+def decode_async(data: bytes, limit: int = 2**16):
+    async def run():
+        stream = asyncio.StreamReader(limit=limit)
+        stream.feed_data(data)
+        stream.feed_eof()
+        return [obj async for obj in decode_async_json_stream(stream)]
+
+    return asyncio.run(run())
+
+
+def test_decode_async_stream():
+    assert decode_async(b'{"type": "a"}\n\n{"type": "b"}\n') == [
+        {"type": "a"},
+        {"type": "b"},
+    ]
+
+
+def test_decode_async_stream_long_line():
+    line = b'{"type": "a", "x": "' + b"x" * 100 + b'"}\n'
+    assert decode_async(line + line, limit=16) == [{"type": "a", "x": "x" * 100}] * 2
+
+
+def test_decode_async_stream_partial():
+    # The remainder of the stream includes the parts that exceeded the limit
+    remainder = b'{"status": "' + b"x" * 100 + b'"}'
+    with pytest.raises(asyncio.IncompleteReadError) as err:
+        decode_async(b'{"type": "a"}\n' + remainder, limit=16)
+    assert err.value.partial == remainder
+
+
+def test_decode_async_stream_error():
+    with pytest.raises(MiniZincError, match="cannot be parsed as JSON"):
+        decode_async(b"{type: a}\n")
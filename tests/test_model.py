@@ -0,0 +1,36 @@
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from copy import copy
+from enum import Enum
+
+import pytest
+
+from minizinc import Model
+
+
+def test_missing_model(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        Model(tmp_path / "missing.mzn")
+
+
+@pytest.mark.parametrize("name", ["missing.json", "missing.dzn", "missing.mzn"])
+def test_add_missing_file(tmp_path, name):
+    model = Model()
+    with pytest.raises(FileNotFoundError):
+        model.add_file(tmp_path / name, parse_data=True)
+    assert model._includes == []
+    assert model._data == {}
+
+
+def test_copy_enum():
+    Colour = Enum("Colour", ["RED", "GREEN"])
+    model = Model()
+    model["Colour"] = Colour
+    copied = copy(model)
+    assert copied["Colour"] is Colour
+    # The identifiers of the enumerated type are still known to the copy
+    assert copied._enum_map == {"RED": Colour.RED, "GREEN": Colour.GREEN}
+    copied._enum_map.clear()
+    assert model._enum_map == {"RED": Colour.RED, "GREEN": Colour.GREEN}
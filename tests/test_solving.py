@@ -7,7 +7,6 @@ import os
 import tempfile
 from dataclasses import fields
 
-import pytest
 from support import InstanceTestCase
 
 from minizinc.instance import Method
@@ -90,6 +89,12 @@ class TestMaximise(InstanceTestCase):
         assert len(result) == 21
         assert result.objective == 25
 
+    def test_no_statistics(self):
+        result = self.instance.solve(collect_statistics=False)
+        assert result.status == Status.OPTIMAL_SOLUTION
+        assert result.objective == 25
+        assert result.statistics == {}
+
     def test_solutions_no_intermediate(self):
         async def run():
             results = []
@@ -141,14 +146,13 @@ class CheckEmpty(InstanceTestCase):
 class FromAsync(InstanceTestCase):
     code = """int: x ::add_to_output = 5;"""
 
-    def test_async_error(self):
-        async def bad_run():
+    def test_solve_in_running_loop(self):
+        async def sync_run():
             return self.instance.solve()
 
-        with pytest.raises(RuntimeError) as exc_info:
-            _ = asyncio.run(bad_run())
-
-        assert "solve_async" in str(exc_info.value)
+        result = asyncio.run(sync_run())
+        assert result.status == Status.SATISFIED
+        assert result["x"] == 5
 
     def test_async_success(self):
         async def good_run():